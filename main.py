@@ -10,38 +10,59 @@
 # - Internal wiring of nodes uses Bezier curves
 
 import sys
-from typing import List, Optional, Type
+from typing import Dict, List, Optional, Tuple, Type
 from PyQt6 import QtWidgets, QtGui, QtCore
 
 from utils import *
 from number import *
 
+# pens partagés, construits une seule fois
+_CONNECTION_PEN = QtGui.QPen(QtGui.QColor(60, 160, 255))
+_CONNECTION_PEN.setWidth(3)
+_CONNECTION_PEN.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
+_CONNECTION_PEN.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
+_DRAG_ANCHOR_PEN = QtGui.QPen(QtGui.QColor(200, 200, 255))
+_DRAG_ANCHOR_PEN.setWidth(2)
+_DRAG_NODE_PEN = QtGui.QPen(QtGui.QColor(200, 255, 200))
+_DRAG_NODE_PEN.setWidth(2)
 
-class ConnectionItem(QtWidgets.QGraphicsPathItem):
+
+def _off_screen(key: Tuple[float, float, float, float, bool], visible: QtCore.QRectF) -> bool:
+    """Vrai si la boîte des extrémités (sx, sy, ex, ey) de key est hors de visible."""
+    sx, sy, ex, ey = key[0], key[1], key[2], key[3]
+    return (max(sx, ex) < visible.left() or min(sx, ex) > visible.right()
+            or max(sy, ey) < visible.top() or min(sy, ey) > visible.bottom())
+
+
+class CurveItem(QtWidgets.QGraphicsPathItem):
+    """Path item dessiné avec antialiasing (la vue ne l'active plus globalement)."""
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionGraphicsItem, widget: Optional[QtWidgets.QWidget] = None) -> None:
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+        super().paint(painter, option, widget)
+
+
+class ConnectionItem(CurveItem):
     def __init__(self, src: Anchor, dst: Anchor, parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
         super().__init__(parent)
         self.src: Anchor = src
         self.dst: Anchor = dst
-        pen = QtGui.QPen(QtGui.QColor(60, 160, 255))
-        pen.setWidth(3)
-        pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
-        pen.setJoinStyle(QtCore.Qt.PenJoinStyle.RoundJoin)
-        self.setPen(pen)
+        self.setPen(_CONNECTION_PEN)
         self.setZValue(-1)
+        self.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        # clé (extrémités scène + état enabled) du dernier path construit
+        self._cache_key: Optional[Tuple[float, float, float, float, bool]] = None
+        self._path = QtGui.QPainterPath()  # réutilisé à chaque reconstruction
         self.update_path()
 
     def remove(self) -> None:
         # retirer la connexion des anchors
-        if self in self.src.connections:
-            self.src.connections.remove(self)
-        if self in self.dst.connections:
-            self.dst.connections.remove(self)
+        self.src.connections.pop(self, None)
+        self.dst.connections.pop(self, None)
 
         # mettre à jour les nodes connectés
-        if hasattr(self.src, "update_node_state"):
-            self.src.update_node_state()
-        if hasattr(self.dst, "update_node_state"):
-            self.dst.update_node_state()
+        self.src.update_node_state()
+        self.dst.update_node_state()
 
         # supprimer du scene
         scene = self.scene()
@@ -49,19 +70,41 @@ class ConnectionItem(QtWidgets.QGraphicsPathItem):
             scene.removeItem(self)
 
     def update_path(self) -> None:
-        if not (self.src.enabled and self.dst.enabled):
-            self.setPath(QtGui.QPainterPath())  # vide
-            return
-
-        src_pt = self.src.node.mapToScene(self.src.pos)
-        dst_pt = self.dst.node.mapToScene(self.dst.pos)
-        path = QtGui.QPainterPath()
-        path.moveTo(src_pt)
-        dx = dst_pt.x() - src_pt.x()
-        ctrl1 = QtCore.QPointF(src_pt.x() + dx * 0.5, src_pt.y())
-        ctrl2 = QtCore.QPointF(dst_pt.x() - dx * 0.5, dst_pt.y())
-        path.cubicTo(ctrl1, ctrl2, dst_pt)
-        self.setPath(path)
+        src_pt = self.src.scene_pos()
+        dst_pt = self.dst.scene_pos()
+        enabled = self.src.enabled and self.dst.enabled
+        key = (src_pt.x(), src_pt.y(), dst_pt.x(), dst_pt.y(), enabled)
+        if key == self._cache_key:
+            return  # rien n’a changé, le path courant est valide
+
+        # hors écran (ancienne et nouvelle courbe) : reconstruction différée au prochain
+        # changement de la zone visible
+        scene = self.scene()
+        visible = scene.visible_rect() if isinstance(scene, NodeScene) else None
+        if visible is not None:
+            # l’ancienne courbe est jugée sur les extrémités de l’ancienne clé : la boîte du
+            # path est de hauteur nulle pour une connexion horizontale et intersects() échoue
+            old = self._cache_key
+            if _off_screen(key, visible) and (old is None or _off_screen(old, visible)):
+                scene.defer_connection(self)
+                return
+        self._cache_key = key
+
+        path = self._path
+        path.clear()
+        if enabled:
+            sx, sy, ex, ey = key[0], key[1], key[2], key[3]
+            path.moveTo(sx, sy)
+            dx = ex - sx
+            dy = ey - sy
+            if abs(dy) < 1.0 or dx * dx + dy * dy < 9.0:
+                # extrémités à la même hauteur (points de contrôle alignés) ou à moins
+                # de 3 px : la courbe se confond avec le segment
+                path.lineTo(ex, ey)
+            else:
+                # surcharge en flottants : pas de QPointF pour les points de contrôle
+                path.cubicTo(sx + dx * 0.5, sy, ex - dx * 0.5, ey, ex, ey)
+        self.setPath(path)  # vide si une extrémité est désactivée
 
 ##########################################################################################
 
@@ -69,17 +112,40 @@ class NodeScene(QtWidgets.QGraphicsScene):
     def __init__(self, parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
         super().__init__(parent)
         self.setBackgroundBrush(QtGui.QBrush(QtGui.QColor(30, 30, 30)))
+        # index spatial explicite : les hit-tests passent par self.items()
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.BspTreeIndex)
 
-        self.nodes: List[Number] = []
-        self.connections: List[ConnectionItem] = []
+        # dicts utilisés comme ensembles ordonnés : appartenance et retrait en O(1)
+        self.nodes: Dict[Number, None] = {}
+        self.connections: Dict[ConnectionItem, None] = {}
 
         # Éléments d’état pour le drag de connexions
-        self.dragging_connection: Optional[ConnectionItem] = None
+        self.dragging_connection: Optional[CurveItem] = None
         self.drag_start_anchor: Optional[Anchor] = None
         self.drag_start_node: Optional[Number] = None
+        self._drag_path = QtGui.QPainterPath()  # réutilisé par la prévisualisation
+
+        # Les mouvements souris sont regroupés : au plus une mise à jour par frame (~16 ms)
+        self._pending_pos: Optional[QtCore.QPointF] = None
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_move)
+
+        # vue principale, renseignée par NodeView (évite la liste de views() à chaque drag)
+        self._view: Optional["NodeView"] = None
+        # zone visible en coordonnées scène (None = à recalculer) et connexions hors écran
+        # dont la reconstruction du path attend un changement de cette zone
+        self._visible_rect: Optional[QtCore.QRectF] = None
+        self._deferred_connections: Dict[ConnectionItem, None] = {}
+        # la vue recentre la scène quand sceneRect grandit, sans scroll : zone à recalculer,
+        # une fois la vue mise à jour (connexion différée)
+        self.sceneRectChanged.connect(self._scene_rect_changed, QtCore.Qt.ConnectionType.QueuedConnection)
 
         # Clipboard
-        self.clipboard_nodes: List[Number] = []
+        # (classe, x, y) par node, et connexions internes (src, sortie, dst, entrée) en indices
+        self.clipboard_nodes: List[Tuple[Type[Number], float, float]] = []
+        self.clipboard_connections: List[Tuple[int, int, int, int]] = []
 
     # ───────────────────────────────
     # NODE CREATION
@@ -121,77 +187,107 @@ class NodeScene(QtWidgets.QGraphicsScene):
         node = node_class()
         node.setPos(pos - QtCore.QPointF(NODE_WIDTH / 2, NODE_HEIGHT / 2))
         self.addItem(node)
-        self.nodes.append(node)
+        self.nodes[node] = None
         return node
 
+    # ───────────────────────────────
+    # VISIBLE AREA
+    # ───────────────────────────────
+    def visible_rect(self) -> Optional[QtCore.QRectF]:
+        """Zone de la scène affichée par la vue (avec une marge pour l’épaisseur des traits)."""
+        if self._visible_rect is None and self._view is not None:
+            view = self._view
+            self._visible_rect = view.mapToScene(view.viewport().rect()).boundingRect().adjusted(
+                -ANCHOR_RADIUS, -ANCHOR_RADIUS, ANCHOR_RADIUS, ANCHOR_RADIUS
+            )
+        return self._visible_rect
+
+    def defer_connection(self, conn: ConnectionItem) -> None:
+        """Marque une connexion hors écran dont le path sera reconstruit plus tard."""
+        self._deferred_connections[conn] = None
+
+    def _scene_rect_changed(self, rect: QtCore.QRectF) -> None:
+        self.viewport_changed()
+
+    def viewport_changed(self) -> None:
+        """Appelé par la vue après un scroll, un zoom ou un redimensionnement, et quand sceneRect change."""
+        self._visible_rect = None
+        deferred = self._deferred_connections
+        if not deferred:
+            return
+        self._deferred_connections = {}
+        for conn in deferred:
+            if conn.scene() is self:  # ignorer les connexions supprimées entre-temps
+                conn.update_path()
+
     # ───────────────────────────────
     # CONNECTION CREATION
     # ───────────────────────────────
     def start_connection_from_anchor(self, anchor: Anchor) -> None:
         """Commence un drag de connexion depuis un anchor."""
         self.drag_start_anchor = anchor
-        self.dragging_connection = QtWidgets.QGraphicsPathItem()
-        pen = QtGui.QPen(QtGui.QColor(200, 200, 255))
-        pen.setWidth(2)
-        self.dragging_connection.setPen(pen)
+        self.dragging_connection = CurveItem()
+        self.dragging_connection.setPen(_DRAG_ANCHOR_PEN)
         self.addItem(self.dragging_connection)
-        self.views()[0].setDragMode(QtWidgets.QGraphicsView.DragMode.NoDrag)
+        self._view.setDragMode(QtWidgets.QGraphicsView.DragMode.NoDrag)
 
     def start_connection_from_node(self, node: Number) -> None:
         """Commence un drag de connexion depuis un node (connect all)."""
         self.drag_start_node = node
-        self.dragging_connection = QtWidgets.QGraphicsPathItem()
-        pen = QtGui.QPen(QtGui.QColor(200, 255, 200))
-        pen.setWidth(2)
-        self.dragging_connection.setPen(pen)
+        self.dragging_connection = CurveItem()
+        self.dragging_connection.setPen(_DRAG_NODE_PEN)
         self.addItem(self.dragging_connection)
-        self.views()[0].setDragMode(QtWidgets.QGraphicsView.DragMode.NoDrag)
+        self._view.setDragMode(QtWidgets.QGraphicsView.DragMode.NoDrag)
 
     def update_drag_connection(self, pos: QtCore.QPointF) -> None:
         """Met à jour la courbe de prévisualisation pendant le drag."""
         if not self.dragging_connection:
             return
 
-        path = QtGui.QPainterPath()
-        node = self.drag_start_anchor.node if self.drag_start_anchor else self.drag_start_node
+        path = self._drag_path
+        path.clear()
 
         start_points = (
-            [self.drag_start_anchor.pos]
+            [self.drag_start_anchor.scene_pos()]
             if self.drag_start_anchor
-            else [a.pos for a in self.drag_start_node.outputs]
+            else [a.scene_pos() for a in self.drag_start_node.outputs]
         )
 
-        for sp in start_points:
-            start_pt = node.mapToScene(sp)
-            end_pt = pos
-            dx = end_pt.x() - start_pt.x()
-            ctrl1 = QtCore.QPointF(start_pt.x() + dx * 0.5, start_pt.y())
-            ctrl2 = QtCore.QPointF(end_pt.x() - dx * 0.5, end_pt.y())
-            path.moveTo(start_pt)
-            path.cubicTo(ctrl1, ctrl2, end_pt)
+        # zone visible, pour ignorer les courbes entièrement hors écran
+        visible = self.visible_rect()
+        left, top, right, bottom = visible.left(), visible.top(), visible.right(), visible.bottom()
+        ex, ey = pos.x(), pos.y()
+
+        for start_pt in start_points:
+            sx, sy = start_pt.x(), start_pt.y()
+            # la courbe reste dans la boîte de ses points de contrôle, ici celle de début/fin
+            if max(sx, ex) < left or min(sx, ex) > right or max(sy, ey) < top or min(sy, ey) > bottom:
+                continue
+            dx = ex - sx
+            path.moveTo(sx, sy)
+            path.cubicTo(sx + dx * 0.5, sy, ex - dx * 0.5, ey, ex, ey)
 
         self.dragging_connection.setPath(path)
 
     def add_connection(self, src_anchor: Anchor, tgt_anchor: Anchor) -> None:
         """Ajoute une connexion valide entre deux anchors."""
-        # Check if connection already exists
-        for existing_conn in src_anchor.connections:
-            if existing_conn.dst == tgt_anchor:
+        # Check if connection already exists (scan the input side, which holds at most one)
+        for existing_conn in tgt_anchor.connections:
+            if existing_conn.src is src_anchor:
                 return  # Connection already exists
         
         # Check if target input already has a connection (inputs should typically have only one)
-        if tgt_anchor.kind == "input" and tgt_anchor.connections:
+        if tgt_anchor.is_input and tgt_anchor.connections:
             # Remove existing connection to input before adding new one
             for old_conn in list(tgt_anchor.connections):
                 old_conn.remove()
-                if old_conn in self.connections:
-                    self.connections.remove(old_conn)
+                self.connections.pop(old_conn, None)
         
         conn = ConnectionItem(src_anchor, tgt_anchor)
         self.addItem(conn)
-        self.connections.append(conn)
-        src_anchor.connections.append(conn)
-        tgt_anchor.connections.append(conn)
+        self.connections[conn] = None
+        src_anchor.connections[conn] = None
+        tgt_anchor.connections[conn] = None
         conn.update_path()
 
         # mise à jour des états internes
@@ -204,17 +300,29 @@ class NodeScene(QtWidgets.QGraphicsScene):
             return
 
         targets = []
+        # requête ponctuelle sur l’index spatial, node le plus haut en premier
         target_node = next(
-            (n for n in self.nodes if n.rect.contains(n.mapFromScene(pos))),
+            (
+                item for item in self.items(
+                    pos,
+                    QtCore.Qt.ItemSelectionMode.IntersectsItemBoundingRect,
+                    QtCore.Qt.SortOrder.DescendingOrder,
+                )
+                if isinstance(item, Number) and item.rect.contains(item.mapFromScene(pos))
+            ),
             None
         )
 
         if target_node:
             if self.drag_start_anchor:
-                for in_anchor in target_node.inputs:
-                    global_pos = target_node.mapToScene(in_anchor.pos)
-                    if (pos - global_pos).manhattanLength() < ANCHOR_RADIUS * 2 \
-                        and in_anchor.name == self.drag_start_anchor.name:
+                # seule l’entrée de même indice est candidate : pas de boucle
+                idx = self.drag_start_anchor.index
+                if idx < len(target_node.inputs):
+                    in_anchor = target_node.inputs[idx]
+                    global_pos = in_anchor.scene_pos()
+                    dx = pos.x() - global_pos.x()
+                    dy = pos.y() - global_pos.y()
+                    if dx * dx + dy * dy < ANCHOR_HIT_R2:
                         targets.append(in_anchor)
             elif self.drag_start_node:
                 # Only connect if both nodes have the same dimension
@@ -222,7 +330,7 @@ class NodeScene(QtWidgets.QGraphicsScene):
                 for i in range(max_connections):
                     out_a = self.drag_start_node.outputs[i]
                     in_a = target_node.inputs[i]
-                    if out_a.name == in_a.name:
+                    if out_a.index == in_a.index:
                         targets.append(in_a)
 
         for tgt in targets:
@@ -230,7 +338,7 @@ class NodeScene(QtWidgets.QGraphicsScene):
                 src = (
                     self.drag_start_anchor
                     if self.drag_start_anchor
-                    else next((o for o in self.drag_start_node.outputs if o.name == tgt.name), None)
+                    else next((o for o in self.drag_start_node.outputs if o.index == tgt.index), None)
                 )
                 if src:  # Only add connection if source anchor is found
                     self.add_connection(src, tgt)
@@ -247,19 +355,29 @@ class NodeScene(QtWidgets.QGraphicsScene):
         self.dragging_connection = None
         self.drag_start_anchor = None
         self.drag_start_node = None
-        self.views()[0].setDragMode(QtWidgets.QGraphicsView.DragMode.RubberBandDrag)
+        self._move_timer.stop()
+        self._pending_pos = None
+        self._view.setDragMode(QtWidgets.QGraphicsView.DragMode.RubberBandDrag)
 
     # ───────────────────────────────
     # MOUSE EVENTS
     # ───────────────────────────────
+    def nodes_near(self, pos: QtCore.QPointF, margin: float) -> List[Number]:
+        """Nodes dont la boîte touche le carré de demi-côté margin autour de pos (index BSP)."""
+        area = QtCore.QRectF(pos.x() - margin, pos.y() - margin, 2 * margin, 2 * margin)
+        return [item for item in self.items(area) if isinstance(item, Number)]
+
     def mousePressEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent):
         pos = event.scenePos()
+        px, py = pos.x(), pos.y()
 
-        for node in self.nodes:
+        for node in self.nodes_near(pos, ANCHOR_RADIUS * 2):
             # clic sur un output : toggle ou drag
             for out_anchor in node.outputs:
-                global_pos = node.mapToScene(out_anchor.pos)
-                if (pos - global_pos).manhattanLength() < ANCHOR_RADIUS * 2:
+                global_pos = out_anchor.scene_pos()
+                dx = px - global_pos.x()
+                dy = py - global_pos.y()
+                if dx * dx + dy * dy < ANCHOR_HIT_R2:
                     if event.button() == QtCore.Qt.MouseButton.RightButton:
                         out_anchor.enabled = not out_anchor.enabled
                         for conn in out_anchor.connections:
@@ -271,16 +389,24 @@ class NodeScene(QtWidgets.QGraphicsScene):
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent) -> None:
-        self.update_drag_connection(event.scenePos())
+        if self.dragging_connection:
+            self._pending_pos = event.scenePos()
+            if not self._move_timer.isActive():
+                self._move_timer.start()
         super().mouseMoveEvent(event)
 
+    def _flush_move(self) -> None:
+        if self._pending_pos is not None:
+            self.update_drag_connection(self._pending_pos)
+            self._pending_pos = None
+
     def mouseReleaseEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent) -> None:
         self.finalize_connection(event.scenePos())
         super().mouseReleaseEvent(event)
 
     def mouseDoubleClickEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent) -> None:
         pos = event.scenePos()
-        for node in self.nodes:
+        for node in (item for item in self.items(pos) if isinstance(item, Number)):
             title_rect = QtCore.QRectF(node.pos(), QtCore.QSizeF(node.rect.width(), HEADER_HEIGHT))
             if node.rect.contains(node.mapFromScene(pos)) and not title_rect.contains(pos):
                 self.start_connection_from_node(node)
@@ -306,54 +432,105 @@ class NodeScene(QtWidgets.QGraphicsScene):
     def delete_selected_nodes(self):
         for item in list(self.selectedItems()):
             if isinstance(item, Number):
-                for anchor in item.inputs + item.outputs:
+                for anchor in item.anchors:
                     for conn in list(anchor.connections):
                         conn.remove()
-                        if conn in self.connections:
-                            self.connections.remove(conn)
-                if item in self.nodes:
-                    self.nodes.remove(item)
+                        self.connections.pop(conn, None)
+                self.nodes.pop(item, None)
                 self.removeItem(item)
 
     def copy_selected_nodes(self):
-        self.clipboard_nodes = [i for i in self.selectedItems() if isinstance(i, Number)]
+        selected = [i for i in self.selectedItems() if isinstance(i, Number)]
+        index = {node: i for i, node in enumerate(selected)}
+        self.clipboard_nodes = [(type(n), n.pos().x(), n.pos().y()) for n in selected]
+        self.clipboard_connections = [
+            (index[node], conn.src.index, index[conn.dst.node], conn.dst.index)
+            for node in selected
+            for anchor in node.outputs
+            for conn in anchor.connections
+            if conn.dst.node in index
+        ]
 
     def paste_nodes(self):
-        offset = QtCore.QPointF(30, 30)
+        offset = 30
         new_nodes = []
-        for node in self.clipboard_nodes:
-            cls = type(node)
-            new_node = cls()
-            new_node.setPos(node.pos() + offset)
-            self.addItem(new_node)
-            self.nodes.append(new_node)
-            new_nodes.append(new_node)
-
-        for n in new_nodes:
-            n.setSelected(True)
+        # insertion en bloc : index BSP reconstruit une seule fois à la fin
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.blockSignals(True)
+        try:
+            for cls, x, y in self.clipboard_nodes:
+                new_node = cls()
+                new_node.setPos(x + offset, y + offset)
+                self.addItem(new_node)
+                self.nodes[new_node] = None
+                new_nodes.append(new_node)
+
+            for src_idx, out_idx, dst_idx, in_idx in self.clipboard_connections:
+                self.add_connection(new_nodes[src_idx].outputs[out_idx], new_nodes[dst_idx].inputs[in_idx])
+
+            for n in new_nodes:
+                n.setSelected(True)
+        finally:
+            self.blockSignals(False)
+            self.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self.update()
 
 class NodeView(QtWidgets.QGraphicsView):
     def __init__(self, scene: NodeScene, parent: Optional[QtWidgets.QWidget] = None):
         super().__init__(scene, parent)
-        
-        self.setRenderHints(
-            QtGui.QPainter.RenderHint.Antialiasing
-            | QtGui.QPainter.RenderHint.TextAntialiasing
-        )
+        scene._view = self
+
+        # pas d'antialiasing global : seuls les items courbes l'activent
+        self.setRenderHints(QtGui.QPainter.RenderHint.TextAntialiasing)
         self.setViewportUpdateMode(
-            QtWidgets.QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+            QtWidgets.QGraphicsView.ViewportUpdateMode.SmartViewportUpdate
         )
+        # chaque item fixe lui-même pen/brush/hints : inutile de sauver l’état du painter
+        self.setOptimizationFlag(QtWidgets.QGraphicsView.OptimizationFlag.DontSavePainterState)
         self.setDragMode(QtWidgets.QGraphicsView.DragMode.RubberBandDrag)
         self.setTransformationAnchor(
             QtWidgets.QGraphicsView.ViewportAnchor.AnchorUnderMouse
         )
         self._panning = False
         self._last_pan_point = None
+        # déplacement de pan cumulé, appliqué aux scrollbars au plus une fois par frame
+        self._pan_delta = QtCore.QPoint()
+        self._pan_timer = QtCore.QTimer(self)
+        self._pan_timer.setSingleShot(True)
+        self._pan_timer.setInterval(16)
+        self._pan_timer.timeout.connect(self._flush_pan)
+
+        # crans de molette cumulés puis appliqués en un seul scale()
+        self._zoom_accum = 0
+        self._zoom_timer = QtCore.QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(8)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
 
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
-        angle = event.angleDelta().y()
-        factor = 1.001**angle
+        self._zoom_accum += event.angleDelta().y()
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+
+    def _apply_zoom(self) -> None:
+        """Applique le zoom cumulé depuis le dernier passage."""
+        factor = 1.001**self._zoom_accum
+        self._zoom_accum = 0
         self.scale(factor, factor)
+        self._notify_viewport_changed()
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        super().scrollContentsBy(dx, dy)
+        self._notify_viewport_changed()
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._notify_viewport_changed()
+
+    def _notify_viewport_changed(self) -> None:
+        scene = self.scene()
+        if isinstance(scene, NodeScene):  # la scène peut déjà être détachée à la fermeture
+            scene.viewport_changed()
 
     # ─────────────── PAN (clic milieu) ───────────────
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
@@ -371,17 +548,30 @@ class NodeView(QtWidgets.QGraphicsView):
             return
 
         if self._panning and self._last_pan_point:
-            delta = event.pos() - self._last_pan_point
+            self._pan_delta += event.pos() - self._last_pan_point
             self._last_pan_point = event.pos()
-            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - delta.x())
-            self.verticalScrollBar().setValue(self.verticalScrollBar().value() - delta.y())
+            if not self._pan_timer.isActive():
+                self._pan_timer.start()
             event.accept()
         else:
             super().mouseMoveEvent(event)
 
+    def _flush_pan(self) -> None:
+        """Applique le pan cumulé en un seul passage sur les scrollbars."""
+        delta = self._pan_delta
+        if delta.isNull():
+            return
+        self._pan_delta = QtCore.QPoint()
+        if delta.x():
+            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - delta.x())
+        if delta.y():
+            self.verticalScrollBar().setValue(self.verticalScrollBar().value() - delta.y())
+
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
         # Relâche le clic milieu
         if event.button() == QtCore.Qt.MouseButton.MiddleButton:
+            self._pan_timer.stop()
+            self._flush_pan()
             self._panning = False
             self._last_pan_point = None
             self.setCursor(QtCore.Qt.CursorShape.ArrowCursor)
@@ -1,100 +1,221 @@
 from __future__ import annotations
-from typing import List, Optional, Tuple, Any
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Any
 from utils import *
 
 from PyQt6 import QtWidgets, QtGui, QtCore
 
+# Brosses des anchors, construites une seule fois à l’import
+_ANCHOR_BRUSHES: Tuple[QtGui.QBrush, ...] = tuple(QtGui.QBrush(color) for color in COLORS)
+_DEFAULT_ANCHOR_BRUSH = QtGui.QBrush(QtGui.QColor(200, 200, 200))
+_DISABLED_ANCHOR_BRUSH = QtGui.QBrush(QtGui.QColor(100, 100, 100))
+
+# Pinceaux du câblage interne et du corps, partagés par tous les nodes
+_ACTIVE_WIRE_PEN = QtGui.QPen(QtGui.QColor(200, 255, 200))
+_ACTIVE_WIRE_PEN.setWidth(2)
+_INACTIVE_WIRE_PEN = QtGui.QPen(QtGui.QColor(180, 180, 180))
+_INACTIVE_WIRE_PEN.setWidth(2)
+_SHADOW_BRUSH = QtGui.QBrush(QtGui.QColor(0, 0, 0, 140))
+_SELECTED_BRUSH = QtGui.QBrush(QtGui.QColor(70, 70, 120))
+_SELECTED_PEN = QtGui.QPen(QtGui.QColor(100, 180, 255))
+_SELECTED_PEN.setWidth(2)
+_TITLE_PEN = QtGui.QPen(QtGui.QColor(220, 220, 220))
+_BODY_PIXMAP_BUDGET = 32 * 1024 * 1024  # octets de corps pré-rendus gardés avant de vider le cache
+_MAX_BODY_SCALE = 2.0  # au-delà, corps dessiné directement (le cache de l’item suffit)
+_MIN_BODY_SCALE = 0.01  # échelle minimale du corps pré-rendu (zoom arrière extrême)
+
+
+def _anchor_brush(index: int) -> QtGui.QBrush:
+    """Brosse de l’unité index, gris par défaut au-delà de COLORS."""
+    return _ANCHOR_BRUSHES[index] if index < len(_ANCHOR_BRUSHES) else _DEFAULT_ANCHOR_BRUSH
+
+
 class Anchor:
-    def __init__(self, node: Number, kind: str, name: str, x: float, y: float):
+    __slots__ = ("node", "is_input", "index", "pos", "connections", "_bit", "_scene_pos")
+
+    def __init__(self, node: Number, kind: str, index: int, pos: QtCore.QPointF):
         self.node = node
-        self.kind = kind  # 'input' or 'output'
-        self.name = name  # 'real' or 'complex'
-        self.pos = QtCore.QPointF(x, y)
-        self.connections = []
-        self.enabled = True  # ⚡ nouveau
+        self.is_input = kind == "input"  # kind : 'input' ou 'output', seul le booléen est conservé
+        self.index = index  # indice de l’unité, comparé à la place du nom
+        self.pos = pos  # partagé entre nodes de même dimension, ne pas muter
+        self.connections: Dict[Any, None] = {}  # ConnectionItem -> None, ensemble ordonné
+        self._bit = 1 << (2 * index + (0 if self.is_input else 1))  # bit dans node.enable_mask
+        node.enable_mask |= self._bit  # ⚡ activé par défaut
+        self._scene_pos: Optional[QtCore.QPointF] = None  # invalidé quand le node bouge
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.node.enable_mask & self._bit)
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        node = self.node
+        mask = node.enable_mask | self._bit if value else node.enable_mask & ~self._bit
+        if mask != node.enable_mask:
+            node.enable_mask = mask
+            node.schedule_update()  # le rendu en cache doit être invalidé
+
+    def scene_pos(self) -> QtCore.QPointF:
+        """Position de l’anchor dans la scène, mise en cache jusqu’au prochain déplacement du node."""
+        if self._scene_pos is None:
+            self._scene_pos = self.node.mapToScene(self.pos)
+        return self._scene_pos
 
     def update_node_state(self):
         """Met à jour l’état du node parent selon les connexions."""
-        if self.kind == "input":
+        if self.is_input:
             node = self.node
-            idx = node.inputs.index(self)
-            node.input_activity[idx] = bool(self.connections)
-            node.update()
+            # les entrées sont rangées par indice : inputs[i].index == i
+            active = bool(self.connections)
+            if node.input_activity[self.index] != active:
+                node.input_activity[self.index] = active
+                # seul le câble interne partant de cette entrée change de couleur
+                node.schedule_update(node.wire_rect(self.index))
+
+
+@lru_cache(maxsize=None)
+def _anchor_layout(dimension: int) -> Tuple[Tuple[QtCore.QPointF, QtCore.QPointF], ...]:
+    """Gabarit (pos entrée, pos sortie) partagé par tous les nodes d’une même dimension."""
+    step = (NODE_HEIGHT - HEADER_HEIGHT) / (dimension + 1)
+    return tuple(
+        (
+            QtCore.QPointF(ANCHOR_RADIUS / 2, HEADER_HEIGHT + (i + 1) * step),
+            QtCore.QPointF(NODE_WIDTH - ANCHOR_RADIUS / 2, HEADER_HEIGHT + (i + 1) * step),
+        )
+        for i in range(dimension)
+    )
+
+
+def _flatten_wiring(wiring: Tuple[Tuple[int, int, bool], ...]) -> Tuple[Tuple[int, int, bool], ...]:
+    """Indices absolus dans inputs + outputs : (entrée, dimension + sortie, switch)."""
+    dimension = len(wiring)  # chaque entrée apparaît une seule fois
+    return tuple((inp_idx, dimension + out_idx, switch) for inp_idx, out_idx, switch in wiring)
 
 
 class Number(QtWidgets.QGraphicsItem):
+    # Câblage interne (in, out, switch), défini une fois par classe
+    wiring: Tuple[Tuple[int, int, bool], ...] = ()
+    _wiring_flat: Tuple[Tuple[int, int, bool], ...] = ()
+    # QPicture du câblage interne, par (classe, entrées actives)
+    _wiring_cache: Dict[Tuple[type, Tuple[bool, ...]], QtGui.QPicture] = {}
+    # corps pré-rendus, par (classe, titre, sélection, échelle)
+    _body_pixmaps: Dict[Tuple[type, str, bool, float], QtGui.QPixmap] = {}
+    _body_pixmap_bytes: int = 0  # taille cumulée de _body_pixmaps
+    # nodes déplacés dont les connexions attendent leur mise à jour groupée
+    _moved_nodes: Dict[Number, None] = {}
+
+    # Style commun, construit une fois pour toutes les instances
+    _bg_brush: QtGui.QBrush = QtGui.QBrush(QtGui.QColor(40, 40, 40))
+    _header_brush: QtGui.QBrush = QtGui.QBrush(QtGui.QColor(60, 60, 60))
+    _pen: QtGui.QPen = QtGui.QPen(QtGui.QColor(20, 20, 20))
+    _title_font: Optional[QtGui.QFont] = None  # police du titre en gras, cf. paint
+
+    # Géométrie commune (constantes de utils, jamais modifiées)
+    _bounding_rect: QtCore.QRectF = NODE_BOUNDING_RECT
+    _shadow_rect: QtCore.QRectF = SHADOW_RECT
+    _header_rect: QtCore.QRectF = HEADER_RECT
+    _header_cover_rect: QtCore.QRectF = HEADER_COVER_RECT
+    _title_rect: QtCore.QRectF = TITLE_RECT
+    _wiring_rect: QtCore.QRectF = WIRING_RECT
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # table aplatie une seule fois par classe
+        cls._wiring_flat = _flatten_wiring(cls.wiring)
+
     def __init__(self, parent: Optional[QtWidgets.QGraphicsItem] = None) -> None:
         super().__init__(parent)
-        self.rect: QtCore.QRectF = QtCore.QRectF(0, 0, NODE_WIDTH, NODE_HEIGHT)
+        self.rect: QtCore.QRectF = NODE_RECT  # partagé entre tous les nodes, ne pas muter
         self.setFlags(
             QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIsMovable
             | QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
             | QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges
+            | QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption
         )
         self.setAcceptHoverEvents(True)
-        self._bg_brush: QtGui.QBrush = QtGui.QBrush(QtGui.QColor(40, 40, 40))
-        self._header_brush: QtGui.QBrush = QtGui.QBrush(QtGui.QColor(60, 60, 60))
-        self._pen: QtGui.QPen = QtGui.QPen(QtGui.QColor(20, 20, 20))
+        # rendu mis en cache (pixmap) tant que update() n’est pas appelé
+        self.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.title: str = ""
 
         self.inputs: List[Anchor] = []
         self.outputs: List[Anchor] = []
         self.input_activity: List[bool] = []
+        self.anchors: Tuple[Anchor, ...] = ()  # inputs + outputs, reconstruit avec eux
+        self._anchor_brushes: Tuple[QtGui.QBrush, ...] = ()  # brosse active, alignée sur anchors
+        self.enable_mask: int = 0  # un bit par anchor, cf. Anchor._bit
         self.active_internal: bool = False  # True si une entrée est connectée
+        self._repaint_pending: bool = False
+        self._dirty_rect: Optional[QtCore.QRectF] = None  # zone cumulée pour le prochain repaint
+
+    def schedule_update(self, rect: Optional[QtCore.QRectF] = None) -> None:
+        """Regroupe les demandes de repaint jusqu’au prochain tour de boucle d’événements.
+
+        rect limite la zone à repeindre (coordonnées locales) ; None repeint tout le node.
+        """
+        if rect is None:
+            rect = self._bounding_rect
+        self._dirty_rect = rect if self._dirty_rect is None else self._dirty_rect.united(rect)
+        if not self._repaint_pending:
+            self._repaint_pending = True
+            QtCore.QTimer.singleShot(0, self._flush_update)
+
+    def _flush_update(self) -> None:
+        rect = self._dirty_rect
+        self._repaint_pending = False
+        self._dirty_rect = None
+        self.update(rect)
+
+    def wire_rect(self, inp_idx: int) -> Optional[QtCore.QRectF]:
+        """Zone du câble interne partant de l’entrée inp_idx (None si aucun câble connu)."""
+        for inp, out_abs, _ in self._wiring_flat:
+            if inp == inp_idx:
+                p1 = self.anchors[inp].pos
+                p2 = self.anchors[out_abs].pos
+                # marge : épaisseur du trait et demi-largeur de la flèche
+                return QtCore.QRectF(p1, p2).normalized().adjusted(
+                    -ANCHOR_RADIUS, -ANCHOR_RADIUS, ANCHOR_RADIUS, ANCHOR_RADIUS
+                )
+        return None
 
     def _build_anchor(self, dimension: int) -> None:
-        h = self.rect.height() - HEADER_HEIGHT
-        step = h / (dimension + 1)
+        layout = _anchor_layout(dimension)
 
-        self.inputs = [
-            Anchor(self, "input", f"unit_{i}", ANCHOR_RADIUS / 2, HEADER_HEIGHT + (i + 1) * step)
-            for i in range(dimension)
-        ]
-        self.outputs = [
-            Anchor(
-                self,
-                "output",
-                f"unit_{i}",
-                self.rect.width() - ANCHOR_RADIUS / 2,
-                HEADER_HEIGHT + (i + 1) * step,
-            )
-            for i in range(dimension)
-        ]
+        self.inputs = [Anchor(self, "input", i, in_pos) for i, (in_pos, _) in enumerate(layout)]
+        self.outputs = [Anchor(self, "output", i, out_pos) for i, (_, out_pos) in enumerate(layout)]
         self.input_activity = [False for _ in self.inputs]
+        self.anchors = tuple(self.inputs) + tuple(self.outputs)
+        self._anchor_brushes = tuple(_anchor_brush(a.index) for a in self.anchors)
 
-    def _draw_internal_wiring(self, painter: QtGui.QPainter, conns: List[Tuple[int, int, bool]]) -> None:
+    def _draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
 
-        for inp_idx, out_idx, switch in conns:
-            pen = QtGui.QPen()
-            pen.setWidth(2)
-            if self.input_activity[inp_idx]:
-                pen.setColor(QtGui.QColor(200, 255, 200))
-            else:
-                pen.setColor(QtGui.QColor(180, 180, 180))
-            painter.setPen(pen)
-            draw_bezier(
-                painter,
-                self.inputs[inp_idx].pos,
-                self.outputs[out_idx].pos,
-                switch=switch,
+        # un path par couleur : deux drawPath au lieu d’un par câble
+        active = QtGui.QPainterPath()
+        inactive = QtGui.QPainterPath()
+        anchors = self.anchors
+        for inp_idx, out_abs, switch in self._wiring_flat:
+            add_bezier(
+                active if self.input_activity[inp_idx] else inactive,
+                anchors[inp_idx].pos, anchors[out_abs].pos, switch=switch,
             )
+        painter.setPen(_INACTIVE_WIRE_PEN)
+        painter.drawPath(inactive)
+        painter.setPen(_ACTIVE_WIRE_PEN)
+        painter.drawPath(active)
 
-    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionGraphicsItem, widget: Optional[QtWidgets.QWidget] = None) -> None:
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-
+    def _paint_body(self, painter: QtGui.QPainter, selected: bool) -> None:
+        """Ombre, corps, header et titre : identiques pour une classe, un titre et un état de sélection."""
         # Ombre
-        shadow_color = QtGui.QColor(0, 0, 0, 140)
-        painter.setBrush(shadow_color)
+        painter.setBrush(_SHADOW_BRUSH)
         painter.setPen(QtCore.Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(self.rect.translated(3, 6), RADIUS, RADIUS)
+        painter.drawRoundedRect(self._shadow_rect, RADIUS, RADIUS)
 
         # Corps
-        if self.isSelected():
+        if selected:
             # couleur différente quand sélectionné (par ex. plus clair ou contour bleu)
-            body_brush = QtGui.QBrush(QtGui.QColor(70, 70, 120))
-            pen = QtGui.QPen(QtGui.QColor(100, 180, 255))
-            pen.setWidth(2)
+            body_brush = _SELECTED_BRUSH
+            pen = _SELECTED_PEN
         else:
             body_brush = self._bg_brush
             pen = self._pen
@@ -104,47 +225,122 @@ class Number(QtWidgets.QGraphicsItem):
         painter.drawRoundedRect(self.rect, RADIUS, RADIUS)
 
         # Header
-        header_rect = QtCore.QRectF(0, 0, self.rect.width(), HEADER_HEIGHT)
         painter.setBrush(self._header_brush)
-        painter.drawRoundedRect(header_rect, RADIUS, RADIUS)
+        painter.drawRoundedRect(self._header_rect, RADIUS, RADIUS)
         painter.setBrush(self._bg_brush)
-        rect_cover = QtCore.QRectF(
-            0, HEADER_HEIGHT - RADIUS, self.rect.width(), float(RADIUS)
-        )
-        painter.drawRect(rect_cover)
-        painter.setPen(QtGui.QColor(220, 220, 220))
-        font = painter.font()
-        font.setBold(True)
-        painter.setFont(font)
+        # rectangle aligné sur les axes : l’antialiasing n’apporte rien
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
+        painter.drawRect(self._header_cover_rect)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(_TITLE_PEN)
+        if Number._title_font is None:
+            # construit au premier paint : un QFont exige l’application Qt déjà créée
+            Number._title_font = QtGui.QFont(painter.font())
+            Number._title_font.setBold(True)
+        painter.setFont(Number._title_font)
         painter.drawText(
-            header_rect.adjusted(6, 0, -6, 0),
+            self._title_rect,
             QtCore.Qt.AlignmentFlag.AlignVCenter | QtCore.Qt.AlignmentFlag.AlignLeft,
             self.title,
         )
 
-        for i, anchor in enumerate(self.inputs + self.outputs):
-            if not anchor.enabled:
-                color = QtGui.QColor(100, 100, 100)
-            else:
-                color = COLORS.get(anchor.name, QtGui.QColor(200, 200, 200))
-            painter.setBrush(QtGui.QBrush(color))
-            painter.setPen(QtCore.Qt.PenStyle.NoPen)
-            painter.drawEllipse(anchor.pos, ANCHOR_RADIUS, ANCHOR_RADIUS)
+    def _body_pixmap(self, selected: bool, scale: float) -> QtGui.QPixmap:
+        """Rendu du corps partagé entre nodes identiques, à la résolution du périphérique."""
+        key = (type(self), self.title, selected, scale)
+        pixmap = Number._body_pixmaps.get(key)
+        if pixmap is None:
+            bounds = self._bounding_rect
+            width = math.ceil(bounds.width() * scale)
+            height = math.ceil(bounds.height() * scale)
+            size = width * height * 4  # ARGB32
+            if Number._body_pixmap_bytes + size > _BODY_PIXMAP_BUDGET:
+                # zooms successifs : on repart de zéro
+                Number._body_pixmaps.clear()
+                Number._body_pixmap_bytes = 0
+            pixmap = QtGui.QPixmap(width, height)
+            pixmap.setDevicePixelRatio(scale)
+            pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+            body_painter = QtGui.QPainter(pixmap)
+            body_painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            body_painter.translate(-bounds.x(), -bounds.y())
+            self._paint_body(body_painter, selected)
+            body_painter.end()
+            Number._body_pixmaps[key] = pixmap
+            Number._body_pixmap_bytes += size
+        return pixmap
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionGraphicsItem, widget: Optional[QtWidgets.QWidget] = None) -> None:
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        # zone à repeindre (précise grâce à ItemUsesExtendedStyleOption)
+        exposed = option.exposedRect
+
+        # corps pré-rendu, à l’échelle effective du périphérique (zoom × HiDPI)
+        lod = QtWidgets.QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        # borné : à 0 le pixmap serait nul et son QPainter inactif
+        scale = max(round(lod * painter.device().devicePixelRatioF(), 2), _MIN_BODY_SCALE)
+        if scale > _MAX_BODY_SCALE:
+            # zoom avant : un pixmap partagé coûterait trop de mémoire
+            self._paint_body(painter, self.isSelected())
+        else:
+            painter.drawPixmap(self._bounding_rect.topLeft(), self._body_pixmap(self.isSelected(), scale))
+
+        # Anchors : seuls ceux dont le disque touche la zone exposée ; la marge couvre le bord
+        # antialiasé et l’arrondi de la zone aux pixels du périphérique
+        margin = ANCHOR_RADIUS + 2
+        left = exposed.left() - margin
+        right = exposed.right() + margin
+        top = exposed.top() - margin
+        bottom = exposed.bottom() + margin
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        for anchor, brush in zip(self.anchors, self._anchor_brushes):
+            pos = anchor.pos
+            if left <= pos.x() <= right and top <= pos.y() <= bottom:
+                painter.setBrush(brush if anchor.enabled else _DISABLED_ANCHOR_BRUSH)
+                painter.drawEllipse(pos, ANCHOR_RADIUS, ANCHOR_RADIUS)
 
-        self.draw_internal_wiring(painter)
+        # le câblage reste sous le header, entre les deux colonnes d’anchors
+        if exposed.intersects(self._wiring_rect):
+            self.draw_internal_wiring(painter)
 
     def itemChange(self, change: QtWidgets.QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
         if change == QtWidgets.QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
-            for anchor in self.inputs + self.outputs:
-                for conn in anchor.connections:
-                    conn.update_path()
+            for anchor in self.anchors:
+                anchor._scene_pos = None
+            # les chemins des connexions sont recalculés une fois par tour de boucle
+            if not Number._moved_nodes:
+                QtCore.QTimer.singleShot(0, Number._flush_moved_nodes)
+            Number._moved_nodes[self] = None
         return super().itemChange(change, value)
 
+    @staticmethod
+    def _flush_moved_nodes() -> None:
+        """Met à jour, une seule fois chacune, les connexions des nodes déplacés."""
+        moved = Number._moved_nodes
+        Number._moved_nodes = {}
+        connections: Dict[Any, None] = {}  # dédoublonne les liens entre deux nodes déplacés
+        for node in moved:
+            for anchor in node.anchors:
+                connections.update(anchor.connections)
+        for conn in connections:
+            conn.update_path()
+
     def boundingRect(self) -> QtCore.QRectF:
-        return self.rect.adjusted(-2, -2, 2, 2)
+        return self._bounding_rect
 
-    def draw_internal_wiring(self, painter):
-        pass
+    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
+        # le câblage ne dépend que de la classe et des entrées actives : rejoué depuis un QPicture
+        key = (type(self), tuple(self.input_activity))
+        picture = Number._wiring_cache.get(key)
+        if picture is None:
+            picture = QtGui.QPicture()
+            recorder = QtGui.QPainter(picture)
+            recorder.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            self._draw_internal_wiring(recorder)
+            recorder.end()
+            Number._wiring_cache[key] = picture
+        # l’état initial du recorder (pas de brosse) n’est pas enregistré dans le QPicture
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        painter.drawPicture(0, 0, picture)
 
 
 class Real(Number):
@@ -154,11 +350,13 @@ class Real(Number):
         h = self.rect.height()
         step = h / 2
 
-        self.inputs = [Anchor(self, "input", "unit_0", ANCHOR_RADIUS / 2, step)]
+        self.inputs = [Anchor(self, "input", 0, QtCore.QPointF(ANCHOR_RADIUS / 2, step))]
         self.outputs = [
-            Anchor(self, "output", "unit_0", self.rect.width() - ANCHOR_RADIUS / 2, step)
+            Anchor(self, "output", 0, QtCore.QPointF(self.rect.width() - ANCHOR_RADIUS / 2, step))
         ]
         self.input_activity = [False for _ in self.inputs]
+        self.anchors = tuple(self.inputs) + tuple(self.outputs)
+        self._anchor_brushes = tuple(_anchor_brush(a.index) for a in self.anchors)
 
 
 class RealUnit(Real):
@@ -166,9 +364,7 @@ class RealUnit(Real):
         super().__init__("1")
 
     def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        pen = QtGui.QPen(QtGui.QColor(180, 180, 180))
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setPen(_INACTIVE_WIRE_PEN)
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)  # évite remplissage parasite
 
         draw_bezier(painter, self.inputs[0].pos, self.outputs[0].pos)
@@ -182,27 +378,23 @@ class ComplexUnit(Number):
 
 
 class ComplexUnit1(ComplexUnit):
+    wiring = (
+        (0, 1, False), # in, out, switch
+        (1, 0, False),
+    )
+
     def __init__(self):
         super().__init__("1")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 1, False), # in, out, switch
-            (1, 0, False),
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 class ComplexUnitI(ComplexUnit):
+    wiring = (
+        (0, 1, False), # in, out, switch
+        (1, 0, True),
+    )
+
     def __init__(self):
         super().__init__("i")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 1, False), # in, out, switch
-            (1, 0, True),
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 
 #############################################################################
 
@@ -215,58 +407,50 @@ class QuaternionUnit(Number):
 
 
 class QuaternionUnit1(QuaternionUnit):
+    wiring = (
+        (0, 0, False), # in, out, switch
+        (1, 1, False),
+        (2, 2, False),
+        (3, 3, False),
+    )
+
     def __init__(self):
         super().__init__("1")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 0, False), # in, out, switch
-            (1, 1, False),
-            (2, 2, False),
-            (3, 3, False),
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 class QuaternionUnitI(QuaternionUnit):
+    wiring = (
+        (0, 1, False), # in, out, switch
+        (1, 0, True),
+        (2, 3, False),
+        (3, 2, True),
+    )
+
     def __init__(self):
         super().__init__("i")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 1, False), # in, out, switch
-            (1, 0, True),
-            (2, 3, False),
-            (3, 2, True),
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 
 class QuaternionUnitJ(QuaternionUnit):
+    wiring = (
+        (0, 2, False), # in, out, switch
+        (1, 3, True),
+        (2, 0, True),
+        (3, 1, False),
+    )
+
     def __init__(self):
         super().__init__("j")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 2, False), # in, out, switch
-            (1, 3, True),
-            (2, 0, True),
-            (3, 1, False),
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 class QuaternionUnitK(QuaternionUnit):
+    wiring = (
+        (0, 3, False), # in, out, switch
+        (1, 2, False),
+        (2, 1, True),
+        (3, 0, True),
+    )
+
     def __init__(self):
         super().__init__("k")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 3, False), # in, out, switch
-            (1, 2, False),
-            (2, 1, True),
-            (3, 0, True),
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 #############################################################################
 
 class BiQuaternionUnit(Number):
@@ -279,140 +463,124 @@ class BiQuaternionUnit(Number):
 
 
 class BiQuaternionUnit1(BiQuaternionUnit):
+    wiring = (
+        (0, 0, False), # in, out, switch
+        (1, 1, False),
+        (2, 2, False),
+        (3, 3, False),
+        (4, 4, False),
+        (5, 5, False),
+        (6, 6, False),
+        (7, 7, False),
+    )
+
     def __init__(self):
         super().__init__("1")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 0, False), # in, out, switch
-            (1, 1, False),
-            (2, 2, False),
-            (3, 3, False),
-            (4, 4, False),
-            (5, 5, False),
-            (6, 6, False),
-            (7, 7, False),
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 class BiQuaternionUniti(BiQuaternionUnit):
+    wiring = (
+        (0, 1, False), # in, out, switch
+        (1, 0, True),
+        (2, 5, False),
+        (3, 6, False),
+        (4, 7, False), 
+        (5, 2, True),
+        (6, 3, True),
+        (7, 4, True),
+    )
+
     def __init__(self):
         super().__init__("i")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 1, False), # in, out, switch
-            (1, 0, True),
-            (2, 5, False),
-            (3, 6, False),
-            (4, 7, False), 
-            (5, 2, True),
-            (6, 3, True),
-            (7, 4, True),
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 class BiQuaternionUnitI(BiQuaternionUnit):
+    wiring = (
+        (0, 2, False), # in, out, switch
+        (1, 5, False),
+        (2, 0, True),
+        (3, 4, False),
+        (4, 3, False), 
+        (5, 1, False),
+        (6, 7, True),
+        (7, 6, True),
+    )
+
     def __init__(self):
         super().__init__("I")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 2, False), # in, out, switch
-            (1, 5, False),
-            (2, 0, True),
-            (3, 4, False),
-            (4, 3, False), 
-            (5, 1, False),
-            (6, 7, True),
-            (7, 6, True),
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 class BiQuaternionUnitiI(BiQuaternionUnit):
+    wiring = (
+        (0, 5, False), # in, out, switch
+        (1, 2, True),
+        (2, 1, True),
+        (3, 7, False),
+        (4, 6, True), 
+        (5, 0, True),
+        (6, 4, True),
+        (7, 3, False),
+    )
+
     def __init__(self):
         super().__init__("iI")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 5, False), # in, out, switch
-            (1, 2, True),
-            (2, 1, True),
-            (3, 7, False),
-            (4, 6, True), 
-            (5, 0, True),
-            (6, 4, True),
-            (7, 3, False),
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 class BiQuaternionUnitJ(BiQuaternionUnit):
+    wiring = (
+        (0, 3, False),  # 1 * J = J
+        (1, 6, False),  # i * J = iJ
+        (2, 4, False),  # I * J = K
+        (3, 0, True),   # J * J = -1
+        (4, 2, True),   # K * J = -I
+        (5, 7, False),  # iI * J = iK
+        (6, 1, True),   # iJ * J = -i
+        (7, 5, True),   # iK * J = -iI
+    )
+
     def __init__(self):
         super().__init__("J")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 3, False),  # 1 * J = J
-            (1, 6, False),  # i * J = iJ
-            (2, 4, False),  # I * J = K
-            (3, 0, True),   # J * J = -1
-            (4, 2, True),   # K * J = -I
-            (5, 7, False),  # iI * J = iK
-            (6, 1, True),   # iJ * J = -i
-            (7, 5, True),   # iK * J = -iI
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 
 class BiQuaternionUnitiJ(BiQuaternionUnit):
+    wiring = (
+        (0, 6, False),  # 1 * iJ = iJ
+        (1, 3, True),   # i * iJ = -J
+        (2, 7, False),  # I * iJ = iK
+        (3, 1, False),  # J * iJ = i
+        (4, 5, False),  # K * iJ = iI
+        (5, 4, True),   # iI * iJ = -K
+        (6, 0, True),   # iJ * iJ = -1
+        (7, 2, True),   # iK * iJ = -I
+    )
+
     def __init__(self):
         super().__init__("iJ")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 6, False),  # 1 * iJ = iJ
-            (1, 3, True),   # i * iJ = -J
-            (2, 7, False),  # I * iJ = iK
-            (3, 1, False),  # J * iJ = i
-            (4, 5, False),  # K * iJ = iI
-            (5, 4, True),   # iI * iJ = -K
-            (6, 0, True),   # iJ * iJ = -1
-            (7, 2, True),   # iK * iJ = -I
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 
 class BiQuaternionUnitK(BiQuaternionUnit):
+    wiring = (
+        (0, 4, False),  # 1 * K = K
+        (1, 7, False),  # i * K = iK
+        (2, 3, True),   # I * K = -J
+        (3, 2, False),  # J * K = I
+        (4, 0, True),   # K * K = -1
+        (5, 6, False),  # iI * K = iJ
+        (6, 5, True),   # iJ * K = -iI
+        (7, 1, True),   # iK * K = -i
+    )
+
     def __init__(self):
         super().__init__("K")
 
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 4, False),  # 1 * K = K
-            (1, 7, False),  # i * K = iK
-            (2, 3, True),   # I * K = -J
-            (3, 2, False),  # J * K = I
-            (4, 0, True),   # K * K = -1
-            (5, 6, False),  # iI * K = iJ
-            (6, 5, True),   # iJ * K = -iI
-            (7, 1, True),   # iK * K = -i
-        ]
-        self._draw_internal_wiring(painter, conns)
-
 
 class BiQuaternionUnitiK(BiQuaternionUnit):
+    wiring = (
+        (0, 7, False),  # 1 * iK = iK
+        (1, 4, True),   # i * iK = -K
+        (2, 6, True),   # I * iK = -iJ
+        (3, 5, False),  # J * iK = iI
+        (4, 1, False),  # K * iK = i
+        (5, 3, True),   # iI * iK = -J
+        (6, 2, False),  # iJ * iK = I
+        (7, 0, True),   # iK * iK = -1
+    )
+
     def __init__(self):
         super().__init__("iK")
-
-    def draw_internal_wiring(self, painter: QtGui.QPainter) -> None:
-        conns = [
-            (0, 7, False),  # 1 * iK = iK
-            (1, 4, True),   # i * iK = -K
-            (2, 6, True),   # I * iK = -iJ
-            (3, 5, False),  # J * iK = iI
-            (4, 1, False),  # K * iK = i
-            (5, 3, True),   # iI * iK = -J
-            (6, 2, False),  # iJ * iK = I
-            (7, 0, True),   # iK * iK = -1
-        ]
-        self._draw_internal_wiring(painter, conns)
@@ -1,6 +1,7 @@
 
 import math
-from typing import Dict, List
+from functools import lru_cache
+from typing import Tuple
 from PyQt6 import QtWidgets, QtGui, QtCore
 
 NODE_WIDTH: int = 180
@@ -8,72 +9,110 @@ NODE_HEIGHT: int = 150
 HEADER_HEIGHT: int = 30
 RADIUS: int = 6
 ANCHOR_RADIUS: int = 6
+ANCHOR_HIT_R2: int = (ANCHOR_RADIUS * 2) ** 2  # rayon de clic au carré
 
-COLORS: Dict[str, QtGui.QColor] = {
-    "unit_0":  QtGui.QColor(255, 180, 120),   # orange clair
-    "unit_1":  QtGui.QColor(120, 200, 255),   # bleu ciel
-    "unit_2":  QtGui.QColor(180, 255, 120),   # vert clair
-    "unit_3":  QtGui.QColor(200, 120, 255),   # violet clair
-    "unit_4":  QtGui.QColor(255, 230, 100),   # jaune orangé
-    "unit_5":  QtGui.QColor(100, 200, 100),   # vert moyen
-    "unit_6":  QtGui.QColor(255, 100, 100),   # rouge clair
-    "unit_7":  QtGui.QColor(100, 100, 255),   # bleu moyen
-    "unit_8":  QtGui.QColor(255, 150, 255),   # rose
-    "unit_9":  QtGui.QColor(150, 255, 150),   # vert très clair
-    "unit_10": QtGui.QColor(255, 200, 100),   # orange saumon
-    "unit_11": QtGui.QColor(100, 255, 200),   # turquoise clair
-    "unit_12": QtGui.QColor(200, 100, 200),   # mauve
-    "unit_13": QtGui.QColor(255, 255, 100),   # jaune pâle
-    "unit_14": QtGui.QColor(100, 150, 255),   # bleu azur
-    "unit_15": QtGui.QColor(200, 200, 100),   # jaune moutarde
-    "unit_16": QtGui.QColor(150, 100, 255),   # lavande
-    "unit_17": QtGui.QColor(255, 100, 200),   # rose vif
-    "unit_18": QtGui.QColor(100, 255, 100),   # vert fluo
-    "unit_19": QtGui.QColor(100, 200, 255),   # bleu pastel
-}
+# Géométrie fixe d’un node, en coordonnées locales, partagée par tous les nodes
+NODE_RECT = QtCore.QRectF(0, 0, NODE_WIDTH, NODE_HEIGHT)
+# inclut les anchors qui débordent sur les côtés et l’ombre décalée de (3, 6)
+NODE_BOUNDING_RECT = NODE_RECT.adjusted(-ANCHOR_RADIUS, -2, ANCHOR_RADIUS, 8)
+SHADOW_RECT = NODE_RECT.translated(3, 6)
+HEADER_RECT = QtCore.QRectF(0, 0, NODE_WIDTH, HEADER_HEIGHT)
+HEADER_COVER_RECT = QtCore.QRectF(0, HEADER_HEIGHT - RADIUS, NODE_WIDTH, RADIUS)  # coins bas du header
+TITLE_RECT = HEADER_RECT.adjusted(6, 0, -6, 0)
+WIRING_RECT = QtCore.QRectF(0, HEADER_HEIGHT, NODE_WIDTH, NODE_HEIGHT - HEADER_HEIGHT)
 
-def draw_bezier(painter: QtGui.QPainter, p1: QtCore.QPointF, p2: QtCore.QPointF, switch: bool = False) -> None:
+# couleur de chaque unité, indexée par Anchor.index
+COLORS: Tuple[QtGui.QColor, ...] = (
+    QtGui.QColor(255, 180, 120),   # unit_0 : orange clair
+    QtGui.QColor(120, 200, 255),   # unit_1 : bleu ciel
+    QtGui.QColor(180, 255, 120),   # unit_2 : vert clair
+    QtGui.QColor(200, 120, 255),   # unit_3 : violet clair
+    QtGui.QColor(255, 230, 100),   # unit_4 : jaune orangé
+    QtGui.QColor(100, 200, 100),   # unit_5 : vert moyen
+    QtGui.QColor(255, 100, 100),   # unit_6 : rouge clair
+    QtGui.QColor(100, 100, 255),   # unit_7 : bleu moyen
+    QtGui.QColor(255, 150, 255),   # unit_8 : rose
+    QtGui.QColor(150, 255, 150),   # unit_9 : vert très clair
+    QtGui.QColor(255, 200, 100),   # unit_10 : orange saumon
+    QtGui.QColor(100, 255, 200),   # unit_11 : turquoise clair
+    QtGui.QColor(200, 100, 200),   # unit_12 : mauve
+    QtGui.QColor(255, 255, 100),   # unit_13 : jaune pâle
+    QtGui.QColor(100, 150, 255),   # unit_14 : bleu azur
+    QtGui.QColor(200, 200, 100),   # unit_15 : jaune moutarde
+    QtGui.QColor(150, 100, 255),   # unit_16 : lavande
+    QtGui.QColor(255, 100, 200),   # unit_17 : rose vif
+    QtGui.QColor(100, 255, 100),   # unit_18 : vert fluo
+    QtGui.QColor(100, 200, 255),   # unit_19 : bleu pastel
+)
+
+# Flèche des câblages inversés, placée en t = 0.1 sur la courbe
+_ARROW_T: float = 0.1
+_B0: float = (1 - _ARROW_T) ** 3                  # poids de Bernstein de p1
+_B1: float = 3 * (1 - _ARROW_T) ** 2 * _ARROW_T   # ... de ctrl1
+_B2: float = 3 * (1 - _ARROW_T) * _ARROW_T ** 2   # ... de ctrl2
+_B3: float = _ARROW_T ** 3                        # ... de p2
+_T0: float = 3 * (1 - _ARROW_T) ** 2              # poids de la dérivée
+_T1: float = 6 * (1 - _ARROW_T) * _ARROW_T
+_T2: float = 3 * _ARROW_T ** 2
+# Les deux points de contrôle ont la même abscisse (x1 + x2) / 2 et reprennent
+# l’ordonnée de leur extrémité : point et tangente se réduisent à des formes
+# linéaires en x1, x2, y1, y2
+_KX1: float = _B0 + (_B1 + _B2) / 2
+_KX2: float = _B3 + (_B1 + _B2) / 2
+_KY1: float = _B0 + _B1
+_KY2: float = _B2 + _B3
+_KDX: float = (_T0 + _T2) / 2                     # dx/dt = _KDX * (x2 - x1)
+_KDY: float = _T1                                 # dy/dt = _KDY * (y2 - y1)
+_ARROW_SIZE: int = 8
+_ARROW = QtGui.QPolygonF([
+    QtCore.QPointF(0, 0),
+    QtCore.QPointF(-_ARROW_SIZE / 2, -_ARROW_SIZE / 2),
+    QtCore.QPointF(-_ARROW_SIZE / 2, _ARROW_SIZE / 2),
+])
+
+
+@lru_cache(maxsize=256)
+def _bezier_path(x1: float, y1: float, x2: float, y2: float) -> QtGui.QPainterPath:
+    """Courbe entre deux anchors, partagée : les positions d’anchors sont fixes par dimension."""
     path = QtGui.QPainterPath()
-    # moveTo précis
-    path.moveTo(QtCore.QPointF(p1.x(), p1.y()))
-    dx = p2.x() - p1.x()
-    ctrl1 = QtCore.QPointF(p1.x() + dx * 0.5, p1.y())
-    ctrl2 = QtCore.QPointF(p2.x() - dx * 0.5, p2.y())
-    path.cubicTo(ctrl1, ctrl2, QtCore.QPointF(p2.x(), p2.y()))
-    painter.drawPath(path)
+    path.moveTo(x1, y1)
+    if abs(y2 - y1) < 1.0:
+        # même hauteur : les quatre points sont alignés, la courbe est un segment
+        path.lineTo(x2, y2)
+        return path
+    dx = x2 - x1
+    path.cubicTo(x1 + dx * 0.5, y1, x2 - dx * 0.5, y2, x2, y2)
+    return path
+
+
+@lru_cache(maxsize=256)
+def _arrow_polygon(x1: float, y1: float, x2: float, y2: float) -> QtGui.QPolygonF:
+    """Petit triangle orienté selon la courbe, posé en t = 0.1 (partagé, ne pas modifier)."""
+    # point de la flèche en t = 0.1 et tangente, coefficients repliés à l’import
+    x: float = _KX1 * x1 + _KX2 * x2
+    y: float = _KY1 * y1 + _KY2 * y2
+    dx_dt: float = _KDX * (x2 - x1)
+    dy_dt: float = _KDY * (y2 - y1)
+
+    # rotation + translation du petit triangle, directement depuis la tangente normalisée
+    length: float = math.hypot(dx_dt, dy_dt)
+    cs, sn = (dx_dt / length, dy_dt / length) if length else (1.0, 0.0)
+    return QtGui.QTransform(cs, sn, -sn, cs, x, y).map(_ARROW)
+
+
+def draw_bezier(painter: QtGui.QPainter, p1: QtCore.QPointF, p2: QtCore.QPointF, switch: bool = False) -> None:
+    x1, y1, x2, y2 = p1.x(), p1.y(), p2.x(), p2.y()
+    painter.drawPath(_bezier_path(x1, y1, x2, y2))
+
+    if switch:
+        painter.drawPolygon(_arrow_polygon(x1, y1, x2, y2))
+
+
+def add_bezier(path: QtGui.QPainterPath, p1: QtCore.QPointF, p2: QtCore.QPointF, switch: bool = False) -> None:
+    """Comme draw_bezier, mais ajoute la courbe (et la flèche) à path sans la dessiner."""
+    x1, y1, x2, y2 = p1.x(), p1.y(), p2.x(), p2.y()
+    path.addPath(_bezier_path(x1, y1, x2, y2))
 
     if switch:
-        # position au milieu (t=0.5)
-        t: float = 0.1
-        x: float = (1-t)**3 * p1.x() + 3*(1-t)**2*t * ctrl1.x() + 3*(1-t)*t**2 * ctrl2.x() + t**3 * p2.x()
-        y: float = (1-t)**3 * p1.y() + 3*(1-t)**2*t * ctrl1.y() + 3*(1-t)*t**2 * ctrl2.y() + t**3 * p2.y()
-        pos = QtCore.QPointF(x, y)
-
-        # direction de la tangente (dérivée en t)
-        dx_dt: float = (
-            3*(1-t)**2*(ctrl1.x()-p1.x())
-            + 6*(1-t)*t*(ctrl2.x()-ctrl1.x())
-            + 3*t**2*(p2.x()-ctrl2.x())
-        )
-        dy_dt: float = (
-            3*(1-t)**2*(ctrl1.y()-p1.y())
-            + 6*(1-t)*t*(ctrl2.y()-ctrl1.y())
-            + 3*t**2*(p2.y()-ctrl2.y())
-        )
-        angle: float = math.atan2(dy_dt, dx_dt)
-
-        # petit triangle
-        size: int = 8
-        pts: List[QtCore.QPointF] = [
-            QtCore.QPointF(0, 0),
-            QtCore.QPointF(-size/2, -size/2),
-            QtCore.QPointF(-size/2, size/2),
-        ]
-
-        # rotation + translation
-        transform = QtGui.QTransform()
-        transform.translate(pos.x(), pos.y())
-        transform.rotateRadians(angle)
-        poly = QtGui.QPolygonF([transform.map(p) for p in pts])
-
-        painter.drawPolygon(poly)
\ No newline at end of file
+        path.addPolygon(_arrow_polygon(x1, y1, x2, y2))
+        path.closeSubpath()
\ No newline at end of file